@@ -1,10 +1,12 @@
 from pathlib import Path
 import sys
+import pickle
 from typing import List, Optional
 
 import click
 import json
 
+from sim_dev_search.processors.dev_embedder import DevelopersEmbedder
 from sim_dev_search.processors.repos_info_extractor import ReposInfoExtractor
 from sim_dev_search.processors.sim_dev_finder import SimilarDevelopersFinder
 from sim_dev_search.processors.stargazers_top_extractor import StargazersTopExtractor
@@ -80,6 +82,59 @@ def stargazers_top(repos_list: List[str], file_path: str, api_token: Optional[st
         json.dump(info_extractor.repositories_top, file_out, indent=4)
 
 
+def _get_default_model_path(embedding_dim: int) -> str:
+    """
+    Get default path to file with developers embeddings model.
+    :param embedding_dim: Size of compressed developers embeddings.
+    :return: Path to file with developers embeddings model.
+    """
+    return str(Path(__file__).absolute().parent.parent / "results" / f"developers_embeddings_{embedding_dim}.pkl")
+
+
+@cli.command("embed")
+@click.option(
+    "-i",
+    "--in-file-path",
+    default=str(Path(__file__).absolute().parent.parent / "results" / "programmers_commits.json"),
+    type=click.Path(file_okay=True, dir_okay=False),
+    help="Path to file with information about developers.",
+)
+@click.option(
+    "-d",
+    "--embedding-dim",
+    default=128,
+    type=click.IntRange(min=1),
+    help="Size of compressed developers embeddings.",
+)
+@click.option(
+    "-m",
+    "--model-path",
+    required=False,
+    type=click.Path(file_okay=True, dir_okay=False),
+    help="Path to file to save developers embeddings model.",
+)
+def embed_developers(in_file_path: str, embedding_dim: int, model_path: Optional[str]) -> None:
+    """
+    Fit compressed developers embeddings and save them for similar developers search.
+    :param in_file_path: Path to file with information about developers.
+    :param embedding_dim: Size of compressed developers embeddings.
+    :param model_path: Path to file to save developers embeddings model.
+    """
+    in_file_path_absolute = Path(in_file_path).absolute()
+    try:
+        with open(in_file_path_absolute, "r", encoding="utf-8") as file_in:
+            developers_info = json.load(file_in)
+    except (json.decoder.JSONDecodeError, FileNotFoundError) as exc:
+        print(f"Exception while getting json from {in_file_path_absolute}: {exc}", file=sys.stderr)
+        return
+    if not developers_info:
+        print(f"Can not fit embeddings on empty developers info from {in_file_path_absolute}!", file=sys.stderr)
+        return
+    model_path_absolute = Path(model_path or _get_default_model_path(embedding_dim)).absolute()
+    SimilarDevelopersFinder().fit_embedder(developers_info, embedding_dim).save(str(model_path_absolute))
+    print(f"Developers embeddings model has been saved to {model_path_absolute}.")
+
+
 @cli.command("sim_dev")
 @click.option(
     "-u",
@@ -101,12 +156,30 @@ def stargazers_top(repos_list: List[str], file_path: str, api_token: Optional[st
     type=click.Path(file_okay=True, dir_okay=False),
     help="Path to file with information about developers.",
 )
-def find_similar_developers(user_email: str, in_file_path: str, out_file_path: str) -> None:
+@click.option(
+    "-d",
+    "--embedding-dim",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Size of compressed developers embeddings saved by embed command to check loaded model.",
+)
+@click.option(
+    "-m",
+    "--model-path",
+    required=False,
+    type=click.Path(file_okay=True, dir_okay=False),
+    help="Path to file with developers embeddings model, raw vectors are compared if neither it nor size is set.",
+)
+def find_similar_developers(
+    user_email: str, in_file_path: str, out_file_path: str, embedding_dim: Optional[int], model_path: Optional[str]
+) -> None:
     """
     Find similar to given developer.
     :param user_email: Email of developer to find similar.
     :param in_file_path: Path to file with information about developers.
     :param out_file_path: Path to file with results.
+    :param embedding_dim: Size of compressed developers embeddings.
+    :param model_path: Path to file with developers embeddings model.
     """
     in_file_path_absolute = Path(in_file_path).absolute()
     try:
@@ -118,7 +191,29 @@ def find_similar_developers(user_email: str, in_file_path: str, out_file_path: s
     if user_email not in developers_info:
         print(f"Can not find developer {user_email} in developers info!", file=sys.stderr)
         return
-    sim_dev_info = SimilarDevelopersFinder().get_similar_developers(user_email, developers_info)
+    finder = SimilarDevelopersFinder()
+    embedder = None
+    if model_path is not None or embedding_dim is not None:
+        model_path_absolute = Path(model_path or _get_default_model_path(embedding_dim)).absolute()
+        try:
+            embedder = DevelopersEmbedder.load(str(model_path_absolute))
+        except (pickle.UnpicklingError, EOFError, FileNotFoundError) as exc:
+            print(f"Exception while loading embeddings model from {model_path_absolute}: {exc}", file=sys.stderr)
+            return
+        if embedding_dim is not None and embedder.embedding_dim != embedding_dim:
+            print(
+                f"Embeddings model {model_path_absolute} has dimension {embedder.embedding_dim}, not {embedding_dim}!",
+                file=sys.stderr,
+            )
+            return
+        unknown_developers = finder.get_unknown_developers(developers_info, embedder, user_email)
+        if unknown_developers:
+            print(
+                f"{len(unknown_developers)} developers from {in_file_path_absolute} are missing in embeddings model "
+                f"{model_path_absolute} and are skipped, refit it with embed command.",
+                file=sys.stderr,
+            )
+    sim_dev_info = finder.get_similar_developers(user_email, developers_info, embedder=embedder)
     if out_file_path:
         out_file_path_absolute = Path(in_file_path).absolute()
     else:
@@ -130,5 +225,48 @@ def find_similar_developers(user_email: str, in_file_path: str, out_file_path: s
     print(f"Similar developers information has been saved to {out_file_path_absolute}.")
 
 
+@cli.command("recall")
+@click.option(
+    "-i",
+    "--in-file-path",
+    default=str(Path(__file__).absolute().parent.parent / "results" / "programmers_commits.json"),
+    type=click.Path(file_okay=True, dir_okay=False),
+    help="Path to file with information about developers.",
+)
+@click.option(
+    "-d",
+    "--embedding-dim",
+    default=128,
+    type=click.IntRange(min=1),
+    help="Size of compressed developers embeddings.",
+)
+@click.option(
+    "-k",
+    "--similar-developers-number",
+    default=15,
+    type=click.IntRange(min=1),
+    help="Number of similar developers to find.",
+)
+def embedding_recall(in_file_path: str, embedding_dim: int, similar_developers_number: int) -> None:
+    """
+    Report recall@k of similar developers search on compressed embeddings against exact cosine similarity.
+    :param in_file_path: Path to file with information about developers.
+    :param embedding_dim: Size of compressed developers embeddings.
+    :param similar_developers_number: Number of similar developers to find.
+    """
+    in_file_path_absolute = Path(in_file_path).absolute()
+    try:
+        with open(in_file_path_absolute, "r", encoding="utf-8") as file_in:
+            developers_info = json.load(file_in)
+    except (json.decoder.JSONDecodeError, FileNotFoundError) as exc:
+        print(f"Exception while getting json from {in_file_path_absolute}: {exc}", file=sys.stderr)
+        return
+    if not developers_info:
+        print(f"Can not fit embeddings on empty developers info from {in_file_path_absolute}!", file=sys.stderr)
+        return
+    recall = SimilarDevelopersFinder().get_embedding_recall(developers_info, embedding_dim, similar_developers_number)
+    print(f"Recall@{similar_developers_number} of {embedding_dim}-dimensional embeddings: {recall:.4f}")
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,155 @@
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction import DictVectorizer
+
+
+class DevelopersEmbedder:
+    """
+    Class that compresses developers feature vectors to int8-quantized dense embeddings.
+    """
+
+    INT8_MAX = 127
+
+    def __init__(self, embedding_dim: int = 128, random_state: int = 0):
+        """
+        Developers embedder initialization.
+        :param embedding_dim: Size of dense developer embeddings.
+        :param random_state: Seed of randomized SVD solver.
+        """
+        if embedding_dim < 1:
+            raise ValueError(f"Embedding dimension must be positive, got {embedding_dim}!")
+        self._embedding_dim = embedding_dim
+        self._random_state = random_state
+        self._vectorizer = DictVectorizer(dtype=np.float32, sparse=True)
+        self._svd: Optional[TruncatedSVD] = None
+        self._is_fitted = False
+        self._emails: List[str] = []
+        self._codes = np.empty((0, 0), dtype=np.int8)
+        self._scales = np.empty(0, dtype=np.float32)
+
+    @property
+    def embedding_dim(self) -> int:
+        """
+        Get requested size of developer embeddings.
+        :return: Size of developer embeddings.
+        """
+        return self._embedding_dim
+
+    @property
+    def emails(self) -> List[str]:
+        """
+        Get emails of embedded developers.
+        :return: Emails of developers in order of their embeddings.
+        """
+        return self._emails
+
+    def _get_features_matrix(self, developers_features: List[Dict[str, Any]]) -> csr_matrix:
+        """
+        Get sparse developers matrix with rows divided by norms of raw feature vectors.
+        Norms are taken before unknown features are dropped, so new developers are scaled as in exact cosine.
+        :param developers_features: List of dicts with features counts of developers.
+        :return: Sparse matrix of unit-normalized developers feature vectors.
+        """
+        dev_matrix = self._vectorizer.transform(developers_features)
+        norms = np.sqrt([sum(value**2 for value in features.values()) for features in developers_features])
+        norms[norms == 0] = 1.0
+        return diags(1 / norms.astype(np.float32)) @ dev_matrix
+
+    def _project(self, dev_matrix: csr_matrix) -> np.ndarray:
+        """
+        Project developers matrix to dense embeddings.
+        :param dev_matrix: Sparse matrix of unit-normalized developers feature vectors.
+        :return: Dense embeddings matrix.
+        """
+        if self._svd is None:
+            return dev_matrix.toarray()
+        return self._svd.transform(dev_matrix)
+
+    def _quantize(self, embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Quantize embeddings to int8 with per-vector scales.
+        :param embeddings: Dense embeddings matrix.
+        :return: Int8 codes and float scales to restore embeddings.
+        """
+        scales = np.abs(embeddings).max(axis=1) / self.INT8_MAX
+        scales[scales == 0] = 1.0
+        codes = np.rint(embeddings / scales[:, None]).astype(np.int8)
+        return codes, scales.astype(np.float32)
+
+    def fit(self, developers_features: Dict[str, Dict[str, Any]]) -> "DevelopersEmbedder":
+        """
+        Fit SVD model on developers matrix and store quantized embeddings of developers.
+        :param developers_features: Dict with features counts of every developer.
+        :return: Fitted embedder.
+        """
+        if not developers_features:
+            raise ValueError("Can not fit embeddings on empty developers info!")
+        developers_features_list = list(developers_features.values())
+        self._vectorizer.fit(developers_features_list)
+        dev_matrix = self._get_features_matrix(developers_features_list)
+
+        # Corpus of n developers has rank at most n, so keep all of it and only project below the features number.
+        n_components = min(self._embedding_dim, dev_matrix.shape[0])
+        self._svd = None
+        if n_components < dev_matrix.shape[1]:
+            self._svd = TruncatedSVD(n_components=n_components, random_state=self._random_state).fit(dev_matrix)
+
+        self._emails = list(developers_features.keys())
+        self._codes, self._scales = self._quantize(self._project(dev_matrix))
+        self._is_fitted = True
+        return self
+
+    def transform(self, developers_features: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Project developers to quantized embeddings with already fitted model.
+        :param developers_features: List of dicts with features counts of developers.
+        :return: Int8 codes and float scales of developers embeddings.
+        """
+        if not self._is_fitted:
+            raise RuntimeError("Embedder must be fitted before transform!")
+        return self._quantize(self._project(self._get_features_matrix(developers_features)))
+
+    def get_similarity_scores(self, developer_features: Dict[str, Any]) -> np.ndarray:
+        """
+        Get approximate cosine similarity between given developer and every embedded developer.
+        :param developer_features: Dict with features counts of developer.
+        :return: Similarity scores in order of embedded developers emails.
+        """
+        query_codes, query_scales = self.transform([developer_features])
+        dot_products = self._codes.astype(np.int32) @ query_codes[0].astype(np.int32)
+        return dot_products * self._scales * query_scales[0]
+
+    def get_block_similarity_scores(self, start: int, stop: int) -> np.ndarray:
+        """
+        Get approximate cosine similarity between block of embedded developers and every embedded developer.
+        :param start: Index of first developer in block.
+        :param stop: Index after last developer in block.
+        :return: Matrix of similarity scores with block developers in rows and all developers in columns.
+        """
+        dot_products = self._codes[start:stop].astype(np.int32) @ self._codes.T.astype(np.int32)
+        return dot_products * self._scales[start:stop, None] * self._scales[None, :]
+
+    def save(self, file_path: str) -> None:
+        """
+        Save fitted embedder to file.
+        :param file_path: Path to file with embedder.
+        """
+        with open(file_path, "wb") as file_out:
+            pickle.dump(self, file_out)
+
+    @staticmethod
+    def load(file_path: str) -> "DevelopersEmbedder":
+        """
+        Load fitted embedder from file.
+        :param file_path: Path to file with embedder.
+        :return: Fitted embedder.
+        """
+        with open(file_path, "rb") as file_in:
+            embedder = pickle.load(file_in)
+        if not isinstance(embedder, DevelopersEmbedder):
+            raise pickle.UnpicklingError(f"File {file_path} does not contain developers embeddings model!")
+        return embedder
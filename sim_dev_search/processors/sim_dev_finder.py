@@ -1,9 +1,13 @@
 from collections import Counter, defaultdict
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from sklearn.feature_extraction import DictVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
+
+from sim_dev_search.processors.dev_embedder import DevelopersEmbedder
 
 
 class SimilarDevelopersFinder:
@@ -13,6 +17,7 @@ class SimilarDevelopersFinder:
 
     LANGUAGE_FIELD = "languages"
     VARIABLES_FIELD = "variables"
+    RECALL_BLOCK_SIZE = 1024
 
     @staticmethod
     def _get_developers_dataframe(developers_info: Dict[str, Any]) -> pd.DataFrame:
@@ -91,12 +96,105 @@ class SimilarDevelopersFinder:
             }
         return similar_developers_info
 
+    @staticmethod
+    def _get_exact_similarity(user_email: str, developers_df: pd.DataFrame) -> List[Tuple[str, float]]:
+        """
+        Get cosine similarity between given developer and other developers on raw feature vectors.
+        :param user_email: Email of developer to find similar.
+        :param developers_df: Pandas dataframe with information about developers.
+        :return: List of other developers emails with similarity scores.
+        """
+        dev_similarity = cosine_similarity(
+            developers_df[developers_df.index != user_email], developers_df[developers_df.index == user_email]
+        ).reshape(-1)
+        return list(zip(developers_df[developers_df.index != user_email].index, dev_similarity))
+
+    def _get_embedding_similarity(
+        self,
+        user_email: str,
+        developers_info: Dict[str, Dict[str, Any]],
+        embedder: DevelopersEmbedder,
+    ) -> List[Tuple[str, float]]:
+        """
+        Get approximate cosine similarity between given developer and other developers on quantized embeddings.
+        :param user_email: Email of developer to find similar.
+        :param developers_info: Dict with information about developers.
+        :param embedder: Fitted embedder with stored developers embeddings.
+        :return: List of other developers emails with similarity scores.
+        """
+        user_features = self._get_developers_info_for_df({user_email: developers_info[user_email]})[user_email]
+        dev_similarity = embedder.get_similarity_scores(user_features)
+        return [
+            (dev_email, float(dev_score))
+            for dev_email, dev_score in zip(embedder.emails, dev_similarity)
+            if dev_email != user_email and dev_email in developers_info
+        ]
+
+    @staticmethod
+    def _get_top_similar(
+        similarity_info: List[Tuple[str, float]], similar_developers_number: int
+    ) -> List[Tuple[str, float]]:
+        """
+        Get top of most similar developers.
+        :param similarity_info: List of developers emails with similarity scores.
+        :param similar_developers_number: Number of similar developers to find.
+        :return: Sorted top of developers emails with similarity scores.
+        """
+        return sorted(similarity_info, key=lambda res: res[1], reverse=True)[:similar_developers_number]
+
+    @staticmethod
+    def _get_block_recall_sum(
+        exact_similarity: np.ndarray, approx_similarity: np.ndarray, block_start: int, top_size: int
+    ) -> float:
+        """
+        Get sum of recalls of approximate similarity tops against exact similarity tops for block of developers.
+        :param exact_similarity: Exact similarity scores with block developers in rows and all developers in columns.
+        :param approx_similarity: Approximate similarity scores with block developers in rows and all in columns.
+        :param block_start: Index of first developer in block.
+        :param top_size: Size of similar developers top.
+        :return: Sum of recall@k over block developers.
+        """
+        block_rows = np.arange(exact_similarity.shape[0])
+        exact_similarity[block_rows, block_start + block_rows] = -np.inf
+        approx_similarity[block_rows, block_start + block_rows] = -np.inf
+        exact_top = np.argpartition(-exact_similarity, top_size - 1, axis=1)[:, :top_size]
+        approx_top = np.argpartition(-approx_similarity, top_size - 1, axis=1)[:, :top_size]
+        return sum(
+            len(set(exact_row) & set(approx_row)) / top_size for exact_row, approx_row in zip(exact_top, approx_top)
+        )
+
+    def fit_embedder(self, developers_info: Dict[str, Dict[str, Any]], embedding_dim: int = 128) -> DevelopersEmbedder:
+        """
+        Fit embedder with compressed embeddings of developers.
+        :param developers_info: Dict with information about developers.
+        :param embedding_dim: Size of compressed developers embeddings.
+        :return: Fitted embedder.
+        """
+        return DevelopersEmbedder(embedding_dim).fit(self._get_developers_info_for_df(developers_info))
+
+    @staticmethod
+    def get_unknown_developers(
+        developers_info: Dict[str, Dict[str, Any]], embedder: DevelopersEmbedder, user_email: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get developers that are missing in embeddings model and can not be found as similar.
+        :param developers_info: Dict with information about developers.
+        :param embedder: Fitted embedder with stored developers embeddings.
+        :param user_email: Email of developer to find similar, it is projected and does not have to be embedded.
+        :return: Emails of developers missing in embeddings model.
+        """
+        embedded_emails = set(embedder.emails)
+        return [
+            dev_email for dev_email in developers_info if dev_email not in embedded_emails and dev_email != user_email
+        ]
+
     def get_similar_developers(
         self,
         user_email: str,
         developers_info: Dict[str, Dict[str, Any]],
         similar_developers_number: int = 15,
         parameters_top_size: int = 15,
+        embedder: Optional[DevelopersEmbedder] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         Get similar developers for given developer.
@@ -104,19 +202,53 @@ class SimilarDevelopersFinder:
         :param developers_info: Dict with information about developers.
         :param similar_developers_number: Number of similar developers to find.
         :param parameters_top_size: Size of parameters used by similar developers top.
+        :param embedder: Fitted embedder to compare compressed embeddings, exact raw vectors are compared if not set.
         :return: Similar developers emails with similarity scores.
         """
-        developers_info_for_df = self._get_developers_info_for_df(developers_info)
-        developers_df = self._get_developers_dataframe(developers_info_for_df)
+        if embedder is not None:
+            res_similarity = self._get_embedding_similarity(user_email, developers_info, embedder)
+        else:
+            developers_info_for_df = self._get_developers_info_for_df(developers_info)
+            developers_df = self._get_developers_dataframe(developers_info_for_df)
+            res_similarity = self._get_exact_similarity(user_email, developers_df)
 
-        dev_similarity = cosine_similarity(
-            developers_df[developers_df.index != user_email], developers_df[developers_df.index == user_email]
-        ).reshape(-1)
-        res_similarity = list(zip(developers_df[developers_df.index != user_email].index, dev_similarity))
-        res_similarity_sorted = sorted(res_similarity, key=lambda res: res[1], reverse=True)[:similar_developers_number]
+        res_similarity_sorted = self._get_top_similar(res_similarity, similar_developers_number)
         res_similarity_info = self._get_similar_developers_info(
             similarity_info=res_similarity_sorted,
             developers_info=developers_info,
             parameters_top_size=parameters_top_size,
         )
         return res_similarity_info
+
+    def get_embedding_recall(
+        self,
+        developers_info: Dict[str, Dict[str, Any]],
+        embedding_dim: int = 128,
+        similar_developers_number: int = 15,
+    ) -> float:
+        """
+        Get mean recall@k of similar developers found on compressed embeddings against exact cosine similarity.
+        :param developers_info: Dict with information about developers.
+        :param embedding_dim: Size of compressed developers embeddings.
+        :param similar_developers_number: Number of similar developers to find.
+        :return: Recall@k averaged over all developers, scores are computed by blocks of developers to bound memory.
+        """
+        developers_info_for_df = self._get_developers_info_for_df(developers_info)
+        vectorizer = DictVectorizer(dtype=np.float32, sparse=True)
+        dev_matrix = normalize(vectorizer.fit_transform(developers_info_for_df.values()))
+        embedder = DevelopersEmbedder(embedding_dim).fit(developers_info_for_df)
+
+        developers_number = dev_matrix.shape[0]
+        top_size = min(similar_developers_number, developers_number - 1)
+        if top_size < 1:
+            return 1.0
+        recalls_sum = 0.0
+        for block_start in range(0, developers_number, self.RECALL_BLOCK_SIZE):
+            block_stop = min(block_start + self.RECALL_BLOCK_SIZE, developers_number)
+            recalls_sum += self._get_block_recall_sum(
+                exact_similarity=(dev_matrix[block_start:block_stop] @ dev_matrix.T).toarray(),
+                approx_similarity=embedder.get_block_similarity_scores(block_start, block_stop),
+                block_start=block_start,
+                top_size=top_size,
+            )
+        return recalls_sum / developers_number
@@ -0,0 +1,158 @@
+import pickle
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict
+from unittest import mock
+
+import numpy as np
+from sklearn.feature_extraction import DictVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from sim_dev_search.processors.dev_embedder import DevelopersEmbedder
+from sim_dev_search.processors.sim_dev_finder import SimilarDevelopersFinder
+
+
+class SimilarDevelopersFinderTestCase(unittest.TestCase):
+    DEVELOPERS_NUMBER = 60
+    GROUPS_NUMBER = 4
+    GROUP_IDENTIFIERS_NUMBER = 50
+    EMBEDDING_DIM = 8
+    SIMILAR_DEVELOPERS_NUMBER = 5
+    SCORES_TOLERANCE = 0.02
+
+    def setUp(self):
+        rnd = random.Random(0)
+        group_profiles = [
+            {f"identifier_{group_idx}_{idx}": rnd.randint(1, 10) for idx in range(self.GROUP_IDENTIFIERS_NUMBER)}
+            for group_idx in range(self.GROUPS_NUMBER)
+        ]
+        self.developers_info = {}
+        for dev_idx in range(self.DEVELOPERS_NUMBER):
+            self.developers_info[f"dev_{dev_idx}@mail.com"] = self._get_developer_info(
+                group_profiles[dev_idx % self.GROUPS_NUMBER],
+                group_profiles[(dev_idx + 1) % self.GROUPS_NUMBER],
+                rnd.randint(1, 5),
+            )
+        self.new_developer_info = self._get_developer_info(group_profiles[0], group_profiles[2], 3)
+        self.new_developer_info["test-repo"][SimilarDevelopersFinder.VARIABLES_FIELD]["unknown_identifier"] = 7
+
+    @staticmethod
+    def _get_developer_info(main_profile: Dict[str, int], side_profile: Dict[str, int], side_weight: int):
+        """
+        Get developer info as a weighted mixture of two identifier profiles.
+        """
+        variables = {name: 5 * count for name, count in main_profile.items()}
+        variables.update({name: side_weight * count for name, count in side_profile.items()})
+        return {
+            "test-repo": {
+                SimilarDevelopersFinder.VARIABLES_FIELD: variables,
+                SimilarDevelopersFinder.LANGUAGE_FIELD: {},
+            }
+        }
+
+    @staticmethod
+    def _get_exact_scores(developers_features: Dict[str, Dict[str, Any]], query_features: Dict[str, Any]):
+        """
+        Get exact cosine similarity between query developer and developers on raw feature vectors.
+        """
+        vectorizer = DictVectorizer(sparse=True).fit([*developers_features.values(), query_features])
+        return cosine_similarity(
+            vectorizer.transform(list(developers_features.values())), vectorizer.transform([query_features])
+        ).reshape(-1)
+
+    def test_similarity_scores_match_exact_cosine(self):
+        finder = SimilarDevelopersFinder()
+        developers_features = finder._get_developers_info_for_df(self.developers_info)
+        embedder = finder.fit_embedder(self.developers_info, self.EMBEDDING_DIM)
+
+        for user_email in embedder.emails[:5]:
+            scores = embedder.get_similarity_scores(developers_features[user_email])
+            exact_scores = self._get_exact_scores(developers_features, developers_features[user_email])
+            np.testing.assert_allclose(scores, exact_scores, atol=self.SCORES_TOLERANCE)
+
+    def test_small_corpus_keeps_full_rank(self):
+        finder = SimilarDevelopersFinder()
+        for developers_number in (2, 3, 5):
+            developers_info = {
+                f"dev_{dev_idx}@mail.com": {
+                    "test-repo": {
+                        SimilarDevelopersFinder.VARIABLES_FIELD: {
+                            f"identifier_{dev_idx}_{idx}": idx + 1 for idx in range(20)
+                        },
+                        SimilarDevelopersFinder.LANGUAGE_FIELD: {"Python": 1},
+                    }
+                }
+                for dev_idx in range(developers_number)
+            }
+            developers_features = finder._get_developers_info_for_df(developers_info)
+            embedder = finder.fit_embedder(developers_info, embedding_dim=128)
+            scores = embedder.get_block_similarity_scores(0, developers_number)
+            for user_idx, user_email in enumerate(embedder.emails):
+                exact_scores = self._get_exact_scores(developers_features, developers_features[user_email])
+                np.testing.assert_allclose(scores[user_idx], exact_scores, atol=self.SCORES_TOLERANCE)
+
+            sim_dev_info = finder.get_similar_developers("dev_0@mail.com", developers_info, embedder=embedder)
+            for dev_info in sim_dev_info.values():
+                self.assertLess(dev_info["similarity_score"], self.SCORES_TOLERANCE)
+
+    def test_transform_new_developer_without_refit(self):
+        finder = SimilarDevelopersFinder()
+        developers_features = finder._get_developers_info_for_df(self.developers_info)
+        embedder = finder.fit_embedder(self.developers_info, self.EMBEDDING_DIM)
+        new_features = finder._get_developers_info_for_df({"new@mail.com": self.new_developer_info})["new@mail.com"]
+
+        scores = embedder.get_similarity_scores(new_features)
+        exact_scores = self._get_exact_scores(developers_features, new_features)
+        np.testing.assert_allclose(scores, exact_scores, atol=self.SCORES_TOLERANCE)
+
+    def test_get_similar_developers_with_embeddings(self):
+        finder = SimilarDevelopersFinder()
+        user_email = "dev_0@mail.com"
+        embedder = finder.fit_embedder(self.developers_info, self.EMBEDDING_DIM)
+        sim_dev_info = finder.get_similar_developers(
+            user_email,
+            self.developers_info,
+            similar_developers_number=self.SIMILAR_DEVELOPERS_NUMBER,
+            embedder=embedder,
+        )
+        self.assertEqual(len(sim_dev_info), self.SIMILAR_DEVELOPERS_NUMBER)
+        self.assertNotIn(user_email, sim_dev_info)
+
+        recall = finder.get_embedding_recall(self.developers_info, self.EMBEDDING_DIM, self.SIMILAR_DEVELOPERS_NUMBER)
+        self.assertGreaterEqual(recall, 0.9)
+
+    def test_recall_does_not_depend_on_block_size(self):
+        finder = SimilarDevelopersFinder()
+        recall = finder.get_embedding_recall(self.developers_info, self.EMBEDDING_DIM, self.SIMILAR_DEVELOPERS_NUMBER)
+        with mock.patch.object(SimilarDevelopersFinder, "RECALL_BLOCK_SIZE", 7):
+            block_recall = finder.get_embedding_recall(
+                self.developers_info, self.EMBEDDING_DIM, self.SIMILAR_DEVELOPERS_NUMBER
+            )
+        self.assertAlmostEqual(recall, block_recall)
+
+    def test_unknown_developers(self):
+        finder = SimilarDevelopersFinder()
+        embedder = finder.fit_embedder(self.developers_info, self.EMBEDDING_DIM)
+        developers_info = {**self.developers_info, "new@mail.com": self.new_developer_info}
+        self.assertEqual(finder.get_unknown_developers(developers_info, embedder), ["new@mail.com"])
+        self.assertEqual(finder.get_unknown_developers(developers_info, embedder, "new@mail.com"), [])
+
+    def test_load_embedder(self):
+        embedder = SimilarDevelopersFinder().fit_embedder(self.developers_info, self.EMBEDDING_DIM)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = str(Path(tmp_dir) / "model.pkl")
+            embedder.save(model_path)
+            self.assertEqual(DevelopersEmbedder.load(model_path).emails, embedder.emails)
+
+            with open(model_path, "wb") as file_out:
+                pickle.dump({"not": "embedder"}, file_out)
+            with self.assertRaises(pickle.UnpicklingError):
+                DevelopersEmbedder.load(model_path)
+
+    def test_invalid_embedding_dim(self):
+        with self.assertRaises(ValueError):
+            DevelopersEmbedder(embedding_dim=0)
+        with self.assertRaises(ValueError):
+            DevelopersEmbedder().fit({})